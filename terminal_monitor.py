@@ -4,15 +4,18 @@ Terminal Website Monitor - A simple console-based website monitoring tool
 that checks website status and latency at regular intervals.
 """
 
-import requests
+import urllib3
 import time
-import datetime
-import statistics
 import signal
+import threading
 import sys
-import argparse
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 import os
+from collections import deque
+import io
+import re
+import shutil
+import socket
 
 # ANSI color codes for terminal output
 class Colors:
@@ -40,23 +43,226 @@ def supports_color():
 # Toggle colors based on terminal capability
 USE_COLORS = supports_color()
 
+# Cursor movement escapes work everywhere except plain Windows consoles
+USE_ANSI = os.name != 'nt' or USE_COLORS
+
 def colored(text, color):
     """Apply color to text if supported."""
     if USE_COLORS:
         return f"{color}{text}{Colors.RESET}"
     return text
 
+# Frames are encoded once and written to the stdout file descriptor directly
+OUTPUT_ENCODING = getattr(sys.stdout, 'encoding', None) or 'utf-8'
+CLEAR_SCREEN = b"\033[2J\033[H"
+MOVE_CURSOR = b"\033[%d;1H"
+ERASE_LINE = b"\033[K"
+ERASE_DOWN = b"\033[J"
+
+ESCAPE_SEQUENCE = re.compile(r"\033\[[0-9;]*[A-Za-z]")
+
+def clip_line(line, width):
+    """Trim a line to width visible characters, not counting escape sequences."""
+    if len(line) <= width:
+        return line
+    
+    parts = []
+    remaining = width
+    pos = 0
+    for match in ESCAPE_SEQUENCE.finditer(line):
+        text = line[pos:match.start()]
+        if len(text) > remaining:
+            break
+        parts.append(text)
+        parts.append(match.group())
+        remaining -= len(text)
+        pos = match.end()
+    else:
+        if len(line) - pos <= remaining:
+            return line
+    
+    parts.append(line[pos:pos + remaining])
+    if parts[:-1]:
+        # The reset at the end of the line may have been cut off
+        parts.append(Colors.RESET)
+    return "".join(parts)
+
+def write_bytes(data):
+    """Write encoded output to stdout, bypassing the text layer where possible."""
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        fd = None
+    
+    # Windows consoles rely on the text layer to handle their code page
+    if fd is None or os.name == 'nt':
+        sys.stdout.write(data.decode(OUTPUT_ENCODING))
+        sys.stdout.flush()
+        return
+    
+    # Keep ordering with anything already buffered by print()
+    sys.stdout.flush()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def format_time(seconds=None):
+    """Format a local time as YYYY-MM-DD HH:MM:SS without going through strftime."""
+    t = time.localtime(seconds)
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+            f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}")
+
+def sgr(*colors):
+    """Convert color codes to a tuple of SGR parameters, e.g. ('96', '1')."""
+    return tuple(color[2:-1] for color in colors)
+
+class Line:
+    """Build a line of colored text using as few escape sequences as possible.
+
+    Spans are styled with SGR parameter tuples from sgr(). An escape sequence is
+    only emitted when the style changes, whitespace never changes it, and the
+    line ends with a single reset.
+    """
+    
+    def __init__(self):
+        self.parts = []
+        self.style = ()
+    
+    def add(self, text, style=()):
+        """Append text in the given style."""
+        if USE_COLORS and style != self.style and not text.isspace():
+            if not style:
+                self.parts.append(Colors.RESET)
+            elif any(p not in style and int(p) < 30 for p in self.style):
+                # Attributes such as bold survive a color change, so clear them
+                self.parts.append(f"\033[0;{';'.join(style)}m")
+            else:
+                self.parts.append(f"\033[{';'.join(style)}m")
+            self.style = style
+        self.parts.append(text)
+        return self
+    
+    def __str__(self):
+        if self.style:
+            return "".join(self.parts) + Colors.RESET
+        return "".join(self.parts)
+
+# Cache DNS lookups so reconnects don't pay for a fresh resolution each time
+DNS_CACHE_TTL = 300
+_dns_cache = {}
+_orig_getaddrinfo = socket.getaddrinfo
+
+def cached_getaddrinfo(host, port, *args, **kwargs):
+    """socket.getaddrinfo wrapper that reuses results for DNS_CACHE_TTL seconds."""
+    key = (host, port, args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    entry = _dns_cache.get(key)
+    if entry and now - entry[0] < DNS_CACHE_TTL:
+        return entry[1]
+    result = _orig_getaddrinfo(host, port, *args, **kwargs)
+    _dns_cache[key] = (now, result)
+    return result
+
+socket.getaddrinfo = cached_getaddrinfo
+
+def normalize_url(url):
+    """Add a missing http:// scheme and exit if the URL is still invalid."""
+    if not urlparse(url).scheme:
+        url = "http://" + url
+    
+    try:
+        result = urlparse(url)
+        if not all([result.scheme, result.netloc]):
+            print(colored("Error: Invalid URL format", Colors.RED))
+            sys.exit(1)
+    except Exception as e:
+        print(colored(f"Error: {str(e)}", Colors.RED))
+        sys.exit(1)
+    return url
+
+# Response time styles for under 100 ms, under 300 ms and slower
+RESPONSE_TIME_STYLES = (sgr(Colors.GREEN), sgr(Colors.YELLOW), sgr(Colors.RED))
+
+def response_time_level(response_time):
+    """Index into RESPONSE_TIME_STYLES for a response time in milliseconds."""
+    return (response_time >= 100) + (response_time >= 300)
+
+class StatusRecord:
+    """Result of a single website check."""
+    
+    __slots__ = ('timestamp', 'status', 'response_time', 'indicator', 'color')
+    
+    def __init__(self, timestamp, status, response_time, indicator, color):
+        self.timestamp = timestamp
+        self.status = status
+        self.response_time = response_time
+        self.indicator = indicator
+        self.color = color
+    
+    @classmethod
+    def from_status_code(cls, timestamp, code, response_time):
+        """Build the record for a check that received an HTTP response."""
+        if code < 400:
+            return cls(timestamp, f"Online (HTTP {code})", response_time, "✓", Colors.GREEN)
+        return cls(timestamp, f"Error (HTTP {code})", response_time, "!", Colors.YELLOW)
+    
+    @classmethod
+    def failed(cls, timestamp, status):
+        """Build the record for a check that received no response."""
+        return cls(timestamp, status, None, "✗", Colors.RED)
+
+MAX_REDIRECTS = 5
+
 class WebsiteMonitor:
-    def __init__(self, url, interval=5, timeout=10):
+    def __init__(self, url, interval=5, timeout=10, keepalive=True):
         self.url = url
         self.interval = interval
         self.timeout = timeout
-        self.response_times = []
+        self.keepalive = keepalive
+        # Statistics cover the most recent response times only
+        self.response_times = deque(maxlen=1000)
+        self._rt_sum = 0
+        self._rt_count = 0
+        self._rt_min = float('inf')
+        self._rt_max = 0
+        self.history = deque(maxlen=10)
         self.success_count = 0
         self.error_count = 0
         self.running = True
+        self._stop = threading.Event()
+        # Guards the counters, statistics and history shared with the worker thread
+        self._lock = threading.Lock()
         self.last_status = None
-        self.start_time = datetime.datetime.now()
+        self.screen = None  # Lines currently shown on the terminal
+        self.screen_size = None
+        self._rendered_checks = 0  # Number of checks the screen reflects
+        self.start_time = time.time()
+        
+        # Reuse keep-alive connections across checks instead of opening a new
+        # TCP/TLS connection every interval. The default pool count keeps a
+        # pool for each end of a redirect (e.g. http -> https), so neither
+        # evicts the other. Only redirects are followed: connection errors,
+        # timeouts and error statuses (even with Retry-After) are reported
+        # rather than retried.
+        self._http = urllib3.PoolManager(
+            maxsize=2,
+            retries=urllib3.Retry(total=MAX_REDIRECTS, connect=False, read=False, other=0,
+                                  status=0, respect_retry_after_header=False),
+            headers=self.request_headers(),
+        )
+        self.use_get = False
+        
+        # Color the static parts of the display once rather than every refresh
+        self._bar = colored("==================================", Colors.CYAN)
+        self._title = colored("    TERMINAL WEBSITE MONITOR     ", Colors.CYAN + Colors.BOLD)
+        self._stats_title = colored("--- Statistics ---", Colors.BLUE)
+        self._recent_title = colored("--- Recent Checks ---", Colors.BLUE)
+        self._no_data = colored("No data collected yet", Colors.GRAY)
+        self._status_templates = self.build_status_templates()
+        self._rate_style = sgr(Colors.GREEN)
+        self._min_style = sgr(Colors.CYAN)
+        self._max_style = sgr(Colors.MAGENTA)
+        self._avg_style = sgr(Colors.BLUE)
         
         # Setup signal handlers for clean exit
         signal.signal(signal.SIGINT, self.handle_exit)
@@ -64,112 +270,224 @@ class WebsiteMonitor:
         
         # Validate URL
         self.validate_url()
+        self.warm_dns_cache()
     
     def validate_url(self):
         """Ensure URL is properly formatted."""
-        if not urlparse(self.url).scheme:
-            self.url = "http://" + self.url
-        
+        self.url = normalize_url(self.url)
+    
+    def warm_dns_cache(self):
+        """Resolve the monitored host once up front."""
+        parsed = urlparse(self.url)
         try:
-            result = urlparse(self.url)
-            if not all([result.scheme, result.netloc]):
-                print(colored("Error: Invalid URL format", Colors.RED))
-                sys.exit(1)
-        except Exception as e:
-            print(colored(f"Error: {str(e)}", Colors.RED))
-            sys.exit(1)
+            port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+            # Same arguments urllib3 uses when opening a connection
+            socket.getaddrinfo(parsed.hostname, port, socket.AF_UNSPEC, socket.SOCK_STREAM)
+        except (socket.gaierror, ValueError):
+            # Resolution errors are reported by the first check instead
+            pass
+    
+    def request_headers(self):
+        """Headers sent with every check."""
+        headers = {'User-Agent': 'sitemonitor'}
+        if self.keepalive:
+            # Ask servers that close connections by default to keep them open
+            # at least as long as typical check intervals
+            headers['Connection'] = 'keep-alive'
+            headers['Keep-Alive'] = 'timeout=60'
+        else:
+            headers['Connection'] = 'close'
+        return headers
     
     def handle_exit(self, signum, frame):
         """Handle Ctrl+C and other termination signals."""
         print("\n" + colored("Stopping website monitoring...", Colors.YELLOW))
         self.running = False
+        self._stop.set()
+        self._http.clear()
         self.print_summary()
         sys.exit(0)
     
     def clear_screen(self):
-        """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
-    
-    def print_header(self):
-        """Print the application header."""
-        self.clear_screen()
-        print(colored("==================================", Colors.CYAN))
-        print(colored("    TERMINAL WEBSITE MONITOR     ", Colors.CYAN + Colors.BOLD))
-        print(colored("==================================", Colors.CYAN))
-        print(f"Monitoring: {colored(self.url, Colors.CYAN)}")
-        print(f"Interval: {colored(f'{self.interval} seconds', Colors.CYAN)}")
-        print(f"Started at: {colored(self.start_time.strftime('%Y-%m-%d %H:%M:%S'), Colors.CYAN)}")
-        print(colored("==================================", Colors.CYAN))
-        print("Press Ctrl+C to exit\n")
+        """Clear a console that doesn't support ANSI escapes."""
+        os.system('cls')
     
-    def check_website(self):
-        """Perform a single website check."""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def draw_frame(self, lines):
+        """Draw a frame, rewriting only the lines that changed since the last one.
+
+        Lines are clipped to the terminal width so they never wrap over other
+        rows. Frames taller than the terminal, and the first frame after a
+        resize, are redrawn in full. The whole frame is encoded into one buffer
+        and written with a single call.
+        """
+        buf = bytearray()
         
-        status_indicator = "✓"
-        status_color = Colors.GREEN
+        if not USE_ANSI:
+            # No cursor addressing, so redraw everything
+            self.clear_screen()
+            for line in lines:
+                buf += line.encode(OUTPUT_ENCODING, 'replace')
+                buf += b"\n"
+        else:
+            size = shutil.get_terminal_size()
+            # Leave the last column free, since filling it leaves the cursor in
+            # a pending wrap where erasing to end of line would hit that column
+            lines = [clip_line(line, size.columns - 1) for line in lines]
+            
+            previous = self.screen
+            if size != self.screen_size:
+                previous = None
+            self.screen_size = size
+            
+            if len(lines) > size.lines:
+                # Rows can't be addressed past the bottom, so let it scroll
+                buf += CLEAR_SCREEN
+                for line in lines:
+                    buf += line.encode(OUTPUT_ENCODING, 'replace')
+                    buf += b"\r\n"
+                self.screen = None
+                write_bytes(buf)
+                return
+            
+            if previous is None:
+                buf += CLEAR_SCREEN
+                previous = []
+            
+            for row, line in enumerate(lines):
+                if row >= len(previous) or previous[row] != line:
+                    buf += MOVE_CURSOR % (row + 1)
+                    buf += line.encode(OUTPUT_ENCODING, 'replace')
+                    buf += ERASE_LINE
+            if len(previous) > len(lines):
+                buf += MOVE_CURSOR % (len(lines) + 1)
+                buf += ERASE_DOWN
+            
+            # Park the cursor below the frame, or on the last row when the
+            # frame fills the screen exactly
+            buf += MOVE_CURSOR % min(len(lines) + 1, size.lines)
+            self.screen = lines
+        
+        write_bytes(buf)
+    
+    def format_header(self):
+        """Build the application header lines."""
+        return [
+            self._bar,
+            self._title,
+            self._bar,
+            f"Monitoring: {colored(self.url, Colors.CYAN)}",
+            f"Interval: {colored(f'{self.interval} seconds', Colors.CYAN)}",
+            f"Started at: {colored(format_time(self.start_time), Colors.CYAN)}",
+            self._bar,
+            "Press Ctrl+C to exit",
+            "",
+        ]
+    
+    def head(self):
+        """Send a HEAD request, following redirects without switching to GET.
+
+        urllib3 turns HEAD into GET on a 303, which would download the body of
+        the redirect target, so redirects are followed here instead.
+        """
+        url = self.url
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._http.request('HEAD', url, timeout=self.timeout, redirect=False)
+            location = response.get_redirect_location()
+            if not location:
+                return response
+            url = urljoin(url, location)
+        raise urllib3.exceptions.ResponseError("too many redirects")
+    
+    def check_website(self):
+        """Perform a single website check.
+
+        Uses a HEAD request, so the measured response time is time to first
+        byte rather than full page download. Servers that reject HEAD with
+        405 are switched to a GET that never reads the body.
+        """
+        timestamp = format_time()
         
         try:
-            start_time = time.time()
-            response = requests.get(self.url, timeout=self.timeout)
-            response_time = time.time() - start_time
+            start = time.perf_counter()
+            if not self.use_get:
+                response = self.head()
+                if response.status == 405:
+                    self.use_get = True
+                    start = time.perf_counter()
+            if self.use_get:
+                response = self._http.request('GET', self.url, timeout=self.timeout,
+                                              preload_content=False)
+                response.close()
+            response_time = time.perf_counter() - start
             response_time_ms = round(response_time * 1000)
             
-            # Add response time to list for statistics
-            self.response_times.append(response_time_ms)
-            
             # Process status code
-            if response.status_code < 400:
-                status = f"Online (HTTP {response.status_code})"
-                self.success_count += 1
-            else:
-                status = f"Error (HTTP {response.status_code})"
-                status_indicator = "!"
-                status_color = Colors.YELLOW
-                self.error_count += 1
+            success = response.status < 400
+            status_data = StatusRecord.from_status_code(timestamp, response.status,
+                                                        response_time_ms)
                 
-        except requests.exceptions.Timeout:
-            status = "Timeout"
+        # NewConnectionError subclasses ConnectTimeoutError, so check it first
+        except (urllib3.exceptions.NewConnectionError, urllib3.exceptions.ProtocolError):
+            status_data = StatusRecord.failed(timestamp, "Connection Failed")
             response_time_ms = None
-            status_indicator = "✗"
-            status_color = Colors.RED
-            self.error_count += 1
+            success = False
             
-        except requests.exceptions.ConnectionError:
-            status = "Connection Failed"
+        except urllib3.exceptions.TimeoutError:
+            status_data = StatusRecord.failed(timestamp, "Timeout")
             response_time_ms = None
-            status_indicator = "✗"
-            status_color = Colors.RED
-            self.error_count += 1
+            success = False
             
-        except requests.exceptions.RequestException as e:
-            status = f"Request Error: {str(e)}"
+        except urllib3.exceptions.HTTPError as e:
+            status_data = StatusRecord.failed(timestamp, f"Request Error: {str(e)}")
             response_time_ms = None
-            status_indicator = "✗"
-            status_color = Colors.RED
-            self.error_count += 1
+            success = False
             
         except Exception as e:
-            status = f"Error: {str(e)}"
+            status_data = StatusRecord.failed(timestamp, f"Error: {str(e)}")
             response_time_ms = None
-            status_indicator = "✗"
-            status_color = Colors.RED
-            self.error_count += 1
+            success = False
         
-        self.last_status = {
-            'timestamp': timestamp,
-            'status': status,
-            'response_time': response_time_ms,
-            'indicator': status_indicator,
-            'color': status_color
-        }
+        with self._lock:
+            if success:
+                self.success_count += 1
+            else:
+                self.error_count += 1
+            
+            # Add response time to list for statistics
+            if response_time_ms is not None:
+                self.record_response_time(response_time_ms)
+            
+            # Keep a history of the last 10 checks
+            self.history.append(status_data)
+            self.last_status = status_data
+        
+        return status_data
+    
+    def record_response_time(self, response_time_ms):
+        """Store a response time, keeping running sum, min and max over the window."""
+        evicted = None
+        if len(self.response_times) == self.response_times.maxlen:
+            evicted = self.response_times[0]
+            self._rt_sum -= evicted
+        self.response_times.append(response_time_ms)
+        self._rt_sum += response_time_ms
+        self._rt_count += 1
         
-        return self.last_status
+        if evicted is not None and evicted in (self._rt_min, self._rt_max):
+            # The old extreme may have left the window, so rescan it
+            self._rt_min = min(self.response_times)
+            self._rt_max = max(self.response_times)
+        else:
+            self._rt_min = min(self._rt_min, response_time_ms)
+            self._rt_max = max(self._rt_max, response_time_ms)
     
     def calculate_statistics(self):
-        """Calculate statistics from response times."""
+        """Calculate statistics from response times.
+
+        Min, max and average are taken over the last 1000 response times.
+        """
         stats = {
-            'count': len(self.response_times),
+            'count': self._rt_count,
             'min': None,
             'max': None,
             'avg': None,
@@ -177,9 +495,9 @@ class WebsiteMonitor:
         }
         
         if self.response_times:
-            stats['min'] = min(self.response_times)
-            stats['max'] = max(self.response_times)
-            stats['avg'] = round(statistics.mean(self.response_times), 1)
+            stats['min'] = self._rt_min
+            stats['max'] = self._rt_max
+            stats['avg'] = round(self._rt_sum / len(self.response_times), 1)
         
         total_checks = self.success_count + self.error_count
         if total_checks > 0:
@@ -187,35 +505,44 @@ class WebsiteMonitor:
         
         return stats
     
-    def print_status_line(self, status_data):
-        """Print a formatted status line."""
-        timestamp = status_data['timestamp']
-        status = status_data['status']
-        response_time = status_data['response_time']
-        indicator = status_data['indicator']
-        color = status_data['color']
+    def build_status_templates(self):
+        """Build %-format templates for status lines with the colors baked in.
+
+        Maps each status color to four templates: one per response time color
+        (under 100 ms, under 300 ms, slower) and one for checks without a
+        response time.
+        """
+        gray = sgr(Colors.GRAY)
         
-        indicator_colored = colored(f"[{indicator}]", color)
-        time_str = colored(timestamp, Colors.GRAY)
-        status_str = colored(status, color)
+        templates = {}
+        for color in (Colors.GREEN, Colors.YELLOW, Colors.RED):
+            style = sgr(color)
+            variants = []
+            for rt_style in RESPONSE_TIME_STYLES + (None,):
+                line = Line()
+                line.add("[%s]", style).add(" ").add("%s", gray).add(" - ").add("%s", style)
+                if rt_style is not None:
+                    line.add(" - ").add("%d ms", rt_style)
+                variants.append(str(line))
+            templates[color] = tuple(variants)
+        return templates
+    
+    def format_status_line(self, status_data):
+        """Build a formatted status line."""
+        templates = self._status_templates[status_data.color]
+        response_time = status_data.response_time
         
         # Format response time if available
-        if response_time is not None:
-            if response_time < 100:
-                rt_color = Colors.GREEN
-            elif response_time < 300:
-                rt_color = Colors.YELLOW
-            else:
-                rt_color = Colors.RED
-            
-            response_str = colored(f"{response_time} ms", rt_color)
-            print(f"{indicator_colored} {time_str} - {status_str} - {response_str}")
-        else:
-            print(f"{indicator_colored} {time_str} - {status_str}")
+        if response_time is None:
+            return templates[3] % (status_data.indicator, status_data.timestamp,
+                                   status_data.status)
+        return templates[response_time_level(response_time)] % (
+            status_data.indicator, status_data.timestamp,
+            status_data.status, response_time)
     
-    def print_statistics(self, stats):
-        """Print current statistics."""
-        print("\n" + colored("--- Statistics ---", Colors.BLUE))
+    def format_statistics(self, stats):
+        """Build the current statistics lines."""
+        lines = ["", self._stats_title]
         
         if stats['count'] > 0:
             # Use separate variables to avoid dictionary access inside f-strings
@@ -225,74 +552,94 @@ class WebsiteMonitor:
             max_time = stats['max']
             avg_time = stats['avg']
             
-            print(f"Checks: {count}")
-            # Create colored strings separately from the f-strings
-            success_rate_colored = colored(f"{success_rate}%", Colors.GREEN)
-            min_time_colored = colored(f"{min_time} ms", Colors.CYAN)
-            max_time_colored = colored(f"{max_time} ms", Colors.MAGENTA)
-            avg_time_colored = colored(f"{avg_time} ms", Colors.BLUE)
-            
-            print(f"Success Rate: {success_rate_colored}")
-            print(f"Min Response: {min_time_colored}")
-            print(f"Max Response: {max_time_colored}")
-            print(f"Avg Response: {avg_time_colored}")
+            lines.append(f"Checks: {count}")
+            lines.append(str(Line().add("Success Rate: ").add(f"{success_rate}%", self._rate_style)))
+            lines.append(str(Line().add("Min Response: ").add(f"{min_time} ms", self._min_style)))
+            lines.append(str(Line().add("Max Response: ").add(f"{max_time} ms", self._max_style)))
+            lines.append(str(Line().add("Avg Response: ").add(f"{avg_time} ms", self._avg_style)))
         else:
-            print(colored("No data collected yet", Colors.GRAY))
+            lines.append(self._no_data)
+        
+        return lines
     
     def print_summary(self):
         """Print a summary of the monitoring session."""
-        duration = datetime.datetime.now() - self.start_time
-        minutes, seconds = divmod(duration.seconds, 60)
+        duration = int(time.time() - self.start_time)
+        minutes, seconds = divmod(duration, 60)
         hours, minutes = divmod(minutes, 60)
         
-        print("\n" + colored("=== Monitoring Summary ===", Colors.CYAN + Colors.BOLD))
-        print(f"URL: {self.url}")
-        print(f"Duration: {hours}h {minutes}m {seconds}s")
-        print(f"Total Checks: {self.success_count + self.error_count}")
-        print(f"Successful: {self.success_count}")
-        print(f"Failed: {self.error_count}")
+        buf = io.StringIO()
+        buf.write("\n" + colored("=== Monitoring Summary ===", Colors.CYAN + Colors.BOLD) + "\n")
+        buf.write(f"URL: {self.url}\n")
+        buf.write(f"Duration: {hours}h {minutes}m {seconds}s\n")
+        buf.write(f"Total Checks: {self.success_count + self.error_count}\n")
+        buf.write(f"Successful: {self.success_count}\n")
+        buf.write(f"Failed: {self.error_count}\n")
         
         stats = self.calculate_statistics()
         if stats['count'] > 0:
-            print(f"Success Rate: {stats['success_rate']}%")
-            print(f"Min Response: {stats['min']} ms")
-            print(f"Max Response: {stats['max']} ms")
-            print(f"Avg Response: {stats['avg']} ms")
+            buf.write(f"Success Rate: {stats['success_rate']}%\n")
+            buf.write(f"Min Response: {stats['min']} ms\n")
+            buf.write(f"Max Response: {stats['max']} ms\n")
+            buf.write(f"Avg Response: {stats['avg']} ms\n")
+        
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+    
+    def probe_loop(self):
+        """Check the website every interval until stopped."""
+        while not self._stop.is_set():
+            self.check_website()
+            
+            # Wait for next check, returning early when stopped
+            if self._stop.wait(self.interval):
+                break
+    
+    def render(self, header):
+        """Draw the latest check results below the header.
+
+        Nothing is drawn until a new check has completed since the last frame.
+        """
+        with self._lock:
+            checks = self.success_count + self.error_count
+            if checks == self._rendered_checks:
+                return
+            self._rendered_checks = checks
+            status_data = self.last_status
+            stats = self.calculate_statistics()
+            history = list(self.history)
+        
+        lines = header + [self.format_status_line(status_data)]
+        
+        # Display statistics
+        lines.extend(self.format_statistics(stats))
+        
+        # Show last 5 checks if we have history
+        if len(history) > 2:
+            lines.append("")
+            lines.append(self._recent_title)
+            # The newest entry is the current check shown above
+            for hist in history[-6:-1]:
+                lines.append(self.format_status_line(hist))
+        
+        self.draw_frame(lines)
     
     def run(self):
-        """Main monitoring loop."""
+        """Main monitoring loop.
+
+        Checks run on a background thread so a slow request never freezes the
+        display, which is refreshed from the latest results about 10 times a
+        second.
+        """
         try:
-            while self.running:
-                self.print_header()
-                
-                # Perform the check
-                status_data = self.check_website()
-                self.print_status_line(status_data)
-                
-                # Calculate and display statistics
-                stats = self.calculate_statistics()
-                self.print_statistics(stats)
-                
-                # Show last 5 checks if we have history
-                if hasattr(self, 'history') and len(self.history) > 1:
-                    print("\n" + colored("--- Recent Checks ---", Colors.BLUE))
-                    for hist in self.history[-5:]:
-                        if hist != status_data:  # Don't repeat the current check
-                            self.print_status_line(hist)
-                
-                # Keep a history of the last 10 checks
-                if not hasattr(self, 'history'):
-                    self.history = []
-                self.history.append(status_data)
-                if len(self.history) > 10:
-                    self.history.pop(0)
-                
-                # Wait for next check
-                if self.running:
-                    for _ in range(self.interval):
-                        if not self.running:
-                            break
-                        time.sleep(1)
+            header = self.format_header()
+            self.draw_frame(header)
+            
+            self._worker = threading.Thread(target=self.probe_loop, daemon=True)
+            self._worker.start()
+            
+            while not self._stop.wait(0.1):
+                self.render(header)
                         
         except Exception as e:
             print(colored(f"Error in monitoring loop: {str(e)}", Colors.RED))
@@ -301,22 +648,195 @@ class WebsiteMonitor:
             if self.running:
                 self.print_summary()
 
-def parse_arguments():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(description="Monitor website status and response times.")
-    parser.add_argument("url", help="URL to monitor (e.g., https://example.com)")
-    parser.add_argument("-i", "--interval", type=int, default=5, 
-                      help="Check interval in seconds (default: 5)")
-    parser.add_argument("-t", "--timeout", type=int, default=10,
-                      help="Request timeout in seconds (default: 10)")
+USAGE = "usage: terminal_monitor.py [-h] [-i INTERVAL] [-t TIMEOUT] [--no-keepalive] url [url ...]"
+
+HELP = f"""{USAGE}
+
+Monitor website status and response times.
+
+positional arguments:
+  url                   URL to monitor (e.g., https://example.com); several URLs
+                        are checked concurrently (requires aiohttp)
+
+options:
+  -h, --help            show this help message and exit
+  -i INTERVAL, --interval INTERVAL
+                        Check interval in seconds (default: 5)
+  -t TIMEOUT, --timeout TIMEOUT
+                        Request timeout in seconds (default: 10)
+  --no-keepalive        Open a new connection for every check
+"""
+
+def usage_error(message):
+    """Print usage and an error message, then exit like argparse does."""
+    sys.stderr.write(f"{USAGE}\nterminal_monitor.py: error: {message}\n")
+    sys.exit(2)
+
+def parse_arguments(argv=None):
+    """Parse command line arguments.
+
+    Hand-rolled instead of argparse to keep startup time down.
+    """
+    args = {'urls': [], 'interval': 5, 'timeout': 10, 'no_keepalive': False}
+    options = {'-i': 'interval', '--interval': 'interval',
+               '-t': 'timeout', '--timeout': 'timeout'}
+    
+    long_options = ('--help', '--interval', '--no-keepalive', '--timeout')
     
-    return parser.parse_args()
+    argv = sys.argv[1:] if argv is None else argv
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        
+        if arg == '--':
+            # Everything after "--" is a URL
+            args['urls'].extend(argv[i:])
+            break
+        if not arg.startswith('-') or arg == '-':
+            args['urls'].append(arg)
+            continue
+        
+        # Accept "-i 5", "-i5", "-i=5", "--interval 5" and "--interval=5"
+        name, value = arg, None
+        if '=' in arg:
+            name, value = arg.split('=', 1)
+        elif arg[:2] in ('-i', '-t') and len(arg) > 2:
+            name, value = arg[:2], arg[2:]
+        
+        # Like argparse, accept unambiguous prefixes of long options
+        if name.startswith('--') and name not in long_options:
+            matches = [option for option in long_options if option.startswith(name)]
+            if len(matches) > 1:
+                usage_error(f"ambiguous option: {name} could match {', '.join(matches)}")
+            if matches:
+                name = matches[0]
+        
+        if name in ('-h', '--help'):
+            sys.stdout.write(HELP)
+            sys.exit(0)
+        elif name == '--no-keepalive':
+            if value is not None:
+                usage_error(f"argument --no-keepalive: ignored explicit argument '{value}'")
+            args['no_keepalive'] = True
+        elif name in options:
+            if value is None:
+                if i >= len(argv):
+                    usage_error(f"argument {name}: expected one argument")
+                value = argv[i]
+                i += 1
+            try:
+                args[options[name]] = int(value)
+            except ValueError:
+                usage_error(f"argument {name}: invalid int value: '{value}'")
+        else:
+            usage_error(f"unrecognized arguments: {arg}")
+    
+    if not args['urls']:
+        usage_error("the following arguments are required: url")
+    
+    return args
+
+async def monitor_many(urls, interval=5, timeout=10, keepalive=True):
+    """Check several URLs concurrently every interval from a single thread.
+
+    One aiohttp session with a shared connector pools connections per host and
+    caches DNS lookups. Prints one status line per URL after each round.
+    SIGTERM cancels monitoring just like Ctrl+C.
+    """
+    import asyncio
+    import aiohttp
+    
+    # URLs whose servers rejected HEAD with 405, checked with GET from then on
+    use_get = set()
+    
+    async def probe(session, url):
+        """Check one URL and return a StatusRecord."""
+        timestamp = format_time()
+        try:
+            start = time.perf_counter()
+            if url not in use_get:
+                async with session.head(url, allow_redirects=True) as response:
+                    code = response.status
+                if code == 405:
+                    use_get.add(url)
+                    start = time.perf_counter()
+            if url in use_get:
+                # Leaving the context without reading releases the body unread
+                async with session.get(url) as response:
+                    code = response.status
+            response_time_ms = round((time.perf_counter() - start) * 1000)
+            return StatusRecord.from_status_code(timestamp, code, response_time_ms)
+        
+        except asyncio.TimeoutError:
+            return StatusRecord.failed(timestamp, "Timeout")
+        except aiohttp.ClientConnectionError:
+            return StatusRecord.failed(timestamp, "Connection Failed")
+        except aiohttp.ClientError as e:
+            return StatusRecord.failed(timestamp, f"Request Error: {str(e)}")
+        except Exception as e:
+            return StatusRecord.failed(timestamp, f"Error: {str(e)}")
+    
+    urls = [normalize_url(url) for url in urls]
+    width = max(len(url) for url in urls)
+    gray = sgr(Colors.GRAY)
+    
+    try:
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGTERM, asyncio.current_task().cancel)
+    except NotImplementedError:
+        # Windows event loops don't support signal handlers
+        pass
+    
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=4, ttl_dns_cache=300,
+                                     force_close=not keepalive)
+    async with aiohttp.ClientSession(connector=connector,
+                                     timeout=aiohttp.ClientTimeout(total=timeout),
+                                     headers={'User-Agent': 'sitemonitor'}) as session:
+        while True:
+            results = await asyncio.gather(*[probe(session, url) for url in urls])
+            
+            buf = io.StringIO()
+            for url, record in zip(urls, results):
+                line = Line()
+                line.add(f"[{record.indicator}]", sgr(record.color)).add(" ")
+                line.add(record.timestamp, gray).add(" ").add(url.ljust(width), sgr(Colors.CYAN))
+                line.add(" - ").add(record.status, sgr(record.color))
+                if record.response_time is not None:
+                    rt_style = RESPONSE_TIME_STYLES[response_time_level(record.response_time)]
+                    line.add(" - ").add(f"{record.response_time} ms", rt_style)
+                buf.write(str(line) + "\n")
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+            
+            await asyncio.sleep(interval)
+
+def run_many(urls, interval, timeout, keepalive=True):
+    """Monitor several URLs until interrupted."""
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError:
+        print(colored("Error: monitoring several URLs requires aiohttp "
+                      "(pip install aiohttp)", Colors.RED))
+        sys.exit(1)
+    
+    import asyncio
+    try:
+        asyncio.run(monitor_many(urls, interval, timeout, keepalive))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\n" + colored("Stopping website monitoring...", Colors.YELLOW))
 
 def main():
     """Main entry point."""
     args = parse_arguments()
     
-    monitor = WebsiteMonitor(args.url, args.interval, args.timeout)
+    if len(args['urls']) > 1:
+        run_many(args['urls'], args['interval'], args['timeout'],
+                 keepalive=not args['no_keepalive'])
+        return
+    
+    monitor = WebsiteMonitor(args['urls'][0], args['interval'], args['timeout'],
+                             keepalive=not args['no_keepalive'])
     monitor.run()
 
 if __name__ == "__main__":